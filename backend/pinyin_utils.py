@@ -1,13 +1,59 @@
+from functools import lru_cache
 from pypinyin import pinyin, Style
 import re
 
+# 模块加载时编译一次：按"连续英文 / 连续中文 / 其他字符"切分，以及判断是否含中文
+_SEG_RE = re.compile(r'([a-zA-Z]+|[\u4e00-\u9fff]+|[^a-zA-Z\u4e00-\u9fff]+)')
+_HAS_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+
+
+# 批量转换的分隔符：非汉字字符，pypinyin 按非汉字切段，分隔后各片段的分词/读音与单独调用一致
+_BATCH_SEP = '\n'
+
+
+def _join_pinyin(items):
+    return '_'.join([item[0] for item in items])
 
-def to_pinyin_list(words, exclude_chars=['%']):
-    pinyin_words = []
-    for word in words:
-        # 使用正则表达式分割中文字符和连续的英文字符
-        parts = re.findall(r'([a-zA-Z]+|[\u4e00-\u9fff]+|[^a-zA-Z\u4e00-\u9fff]+)', word)
 
+def _cjk_parts_to_pinyin(cjk_parts):
+    """Convert all CJK parts with a single pinyin() call; returns {part: 'pin_yin'}."""
+    if not cjk_parts:
+        return {}
+    items = pinyin(_BATCH_SEP.join(cjk_parts), style=Style.NORMAL)
+    result = {}
+    pos = 0
+    for idx, part in enumerate(cjk_parts):
+        if idx:
+            # 每个分隔符应单独成为一项；不符合预期时回退为逐段转换
+            if pos >= len(items) or items[pos][0] != _BATCH_SEP:
+                break
+            pos += 1
+        # 汉字每字对应一项
+        result[part] = _join_pinyin(items[pos:pos + len(part)])
+        pos += len(part)
+    if len(result) != len(cjk_parts) or pos != len(items):
+        return {part: _join_pinyin(pinyin(part, style=Style.NORMAL)) for part in cjk_parts}
+    return result
+
+
+# 同一表头结构每次上传都会重复转换，按 (表头元组, 排除字符元组) 缓存整体结果
+@lru_cache(maxsize=1024)
+def _to_pinyin_tuple(words, exclude_chars):
+    # 使用正则表达式分割中文字符和连续的英文字符
+    word_parts = [_SEG_RE.findall(word) for word in words]
+
+    # 先收集全部中文片段（去重），一次 pinyin() 调用完成转换
+    cjk_parts = []
+    for parts in word_parts:
+        for part in parts:
+            if part in exclude_chars or (part.isalpha() and not '\u4e00' <= part <= '\u9fff'):
+                continue
+            if _HAS_CJK_RE.search(part) is not None:
+                cjk_parts.append(part)
+    cjk_pinyin = _cjk_parts_to_pinyin(list(dict.fromkeys(cjk_parts)))
+
+    pinyin_words = []
+    for parts in word_parts:
         # 对每个部分处理
         pinyin_parts = []
         for part in parts:
@@ -15,22 +61,20 @@ def to_pinyin_list(words, exclude_chars=['%']):
                 continue
             if part.isalpha() and not '\u4e00' <= part <= '\u9fff':  # 纯英文字母
                 pinyin_parts.append(part.lower())
-            elif any('\u4e00' <= c <= '\u9fff' for c in part):  # 包含中文
-                pinyin_part = pinyin(part, style=Style.NORMAL)
-                pinyin_parts.append('_'.join([item[0] for item in pinyin_part]))
+            elif part in cjk_pinyin:  # 包含中文
+                pinyin_parts.append(cjk_pinyin[part])
             else:  # 其他字符（如标点符号）
                 pinyin_parts.append(part.lower())
 
         # 合并所有部分
-        pinyin_word = '_'.join(pinyin_parts)
-        pinyin_words.append(pinyin_word)
+        pinyin_words.append('_'.join(pinyin_parts))
 
     assert len(pinyin_words) == len(words)
-    
+
     # Handle duplicates by adding suffix numbers
     unique_pinyin_words = []
     seen = {}
-    
+
     for word in pinyin_words:
         if word in seen:
             seen[word] += 1
@@ -39,10 +83,15 @@ def to_pinyin_list(words, exclude_chars=['%']):
             seen[word] = 0
             unique_word = word
         unique_pinyin_words.append(unique_word)
-    
+
     assert len(unique_pinyin_words) == len(words)
     assert len(unique_pinyin_words) == len(set(unique_pinyin_words))
-    return unique_pinyin_words
+    return tuple(unique_pinyin_words)
+
+
+def to_pinyin_list(words, exclude_chars=('%',)):
+    # 返回新列表，调用方修改不会污染缓存
+    return list(_to_pinyin_tuple(tuple(words), tuple(exclude_chars)))
 
 
 if __name__ == '__main__':
@@ -51,4 +100,4 @@ if __name__ == '__main__':
              '聚合组数', 'PON单板数', 'PON端口数', 'PON端口使用数', 'PON端口空闲数',
              'PON端口使用率(%)', '总槽位数', '已占用槽位', '空闲槽位数', '槽位使用率(%)',
              '主控单板数', '级联单板数', '业务单板数', '上行单板数', '电源单板数']
-    print(to_pinyin_list(words))
\ No newline at end of file
+    print(to_pinyin_list(words))